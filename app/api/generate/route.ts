@@ -1,8 +1,22 @@
 import { spawn } from 'child_process';
+import type { GenerationOptions } from '../../../types/types';
+
+type GenerationEvent =
+  | { type: 'log' | 'error'; message: string }
+  | { type: 'end'; code: number | null };
+
+// Shared by every request; TextEncoder holds no per-stream state
+const encoder = new TextEncoder();
+
+/**
+ * Serializes an event as a single encoded SSE frame
+ */
+function encodeEvent(event: GenerationEvent): Uint8Array {
+  return encoder.encode(`data: ${JSON.stringify(event)}\n\n`);
+}
 
 export async function POST(request: Request) {
-  const encoder = new TextEncoder();
-  const options = await request.json();
+  const options: GenerationOptions = await request.json();
   
   const customReadable = new ReadableStream({
     async start(controller) {
@@ -23,25 +37,28 @@ export async function POST(request: Request) {
 
         // Log the command being executed
         const commandStr = `bun ${args.join(' ')}`;
-        controller.enqueue(encoder.encode(`data: ${JSON.stringify({ type: 'log', message: `Executing command: ${commandStr}` })}\n\n`));
+        controller.enqueue(encodeEvent({ type: 'log', message: `Executing command: ${commandStr}` }));
 
         // Spawn the bun process
         const process = spawn('bun', args);
 
+        // Decode output as a stream so multi-byte characters split across
+        // chunks are kept whole, and each chunk arrives as a string
+        process.stdout.setEncoding('utf8');
+        process.stderr.setEncoding('utf8');
+
         // Handle process events
-        process.stdout.on('data', (data) => {
+        process.stdout.on('data', (message: string) => {
           try {
-            const message = data.toString();
-            controller.enqueue(encoder.encode(`data: ${JSON.stringify({ type: 'log', message })}\n\n`));
+            controller.enqueue(encodeEvent({ type: 'log', message }));
           } catch (error) {
             // Ignore enqueue errors if the stream is already closed
           }
         });
 
-        process.stderr.on('data', (data) => {
+        process.stderr.on('data', (message: string) => {
           try {
-            const message = data.toString();
-            controller.enqueue(encoder.encode(`data: ${JSON.stringify({ type: 'error', message })}\n\n`));
+            controller.enqueue(encodeEvent({ type: 'error', message }));
           } catch (error) {
             // Ignore enqueue errors if the stream is already closed
           }
@@ -49,7 +66,7 @@ export async function POST(request: Request) {
 
         process.on('close', (code) => {
           try {
-            controller.enqueue(encoder.encode(`data: ${JSON.stringify({ type: 'end', code })}\n\n`));
+            controller.enqueue(encodeEvent({ type: 'end', code }));
             controller.close();
           } catch (error) {
             // Ignore enqueue errors if the stream is already closed
@@ -58,7 +75,7 @@ export async function POST(request: Request) {
 
         process.on('error', (error: Error) => {
           try {
-            controller.enqueue(encoder.encode(`data: ${JSON.stringify({ type: 'error', message: error.message })}\n\n`));
+            controller.enqueue(encodeEvent({ type: 'error', message: error.message }));
             controller.close();
           } catch (err) {
             // Ignore enqueue errors if the stream is already closed
@@ -66,7 +83,7 @@ export async function POST(request: Request) {
         });
       } catch (error) {
         try {
-          controller.enqueue(encoder.encode(`data: ${JSON.stringify({ type: 'error', message: 'Failed to start generation process' })}\n\n`));
+          controller.enqueue(encodeEvent({ type: 'error', message: 'Failed to start generation process' }));
           controller.close();
         } catch (err) {
           // Ignore enqueue errors if the stream is already closed
@@ -76,8 +93,8 @@ export async function POST(request: Request) {
     cancel(controller) {
       // Handle stream cancellation
       try {
-        controller.enqueue(encoder.encode(`data: ${JSON.stringify({ type: 'log', message: 'Stream cancelled by client' })}\n\n`));
-        controller.enqueue(encoder.encode(`data: ${JSON.stringify({ type: 'end', code: -1 })}\n\n`));
+        controller.enqueue(encodeEvent({ type: 'log', message: 'Stream cancelled by client' }));
+        controller.enqueue(encodeEvent({ type: 'end', code: -1 }));
       } catch (error) {
         // Ignore enqueue errors if the stream is already closed
       }
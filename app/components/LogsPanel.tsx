@@ -12,6 +12,45 @@ type LogsPanelProps = {
   logsEndRef: RefObject<HTMLDivElement>;
 };
 
+type LogKind = 'error' | 'success' | 'warning' | 'default';
+
+// Row styling per log kind, shared by every render
+const LOG_STYLES: Readonly<Record<LogKind, { bgColor: string; borderColor: string; iconClass: string | null }>> = Object.freeze({
+  error: {
+    bgColor: 'bg-red-500/10 hover:bg-red-500/20',
+    borderColor: 'border-red-500/30',
+    iconClass: 'ri-error-warning-line text-red-500'
+  },
+  success: {
+    bgColor: 'bg-green-500/10 hover:bg-green-500/20',
+    borderColor: 'border-green-500/30',
+    iconClass: 'ri-checkbox-circle-line text-green-500'
+  },
+  warning: {
+    bgColor: 'bg-yellow-500/10 hover:bg-yellow-500/20',
+    borderColor: 'border-yellow-500/30',
+    iconClass: 'ri-alert-line text-yellow-500'
+  },
+  default: {
+    bgColor: 'hover:bg-slate-800/50',
+    borderColor: 'border-slate-700/50',
+    iconClass: null
+  }
+});
+
+/**
+ * Classify a log line by its keywords, lower-casing it only once
+ * @param log - Log line
+ * @returns Log kind
+ */
+function getLogKind(log: string): LogKind {
+  const text = log.toLowerCase();
+  if (text.includes('error') || text.includes('fail')) return 'error';
+  if (text.includes('complet') || text.includes('success')) return 'success';
+  if (text.includes('warning') || text.includes('stopping')) return 'warning';
+  return 'default';
+}
+
 /**
  * LogsPanel component for displaying execution logs
  */
@@ -40,27 +79,7 @@ export function LogsPanel({ logs, logsEndRef }: LogsPanelProps) {
                 </div>
               ) : (
                 logs.map((log, index) => {
-                  const isError = log.toLowerCase().includes('error') || log.toLowerCase().includes('fail');
-                  const isSuccess = log.toLowerCase().includes('complet') || log.toLowerCase().includes('success');
-                  const isWarning = log.toLowerCase().includes('warning') || log.toLowerCase().includes('stopping');
-                  
-                  let bgColor = 'hover:bg-slate-800/50';
-                  let borderColor = 'border-slate-700/50';
-                  let icon = null;
-
-                  if (isError) {
-                    bgColor = 'bg-red-500/10 hover:bg-red-500/20';
-                    borderColor = 'border-red-500/30';
-                    icon = <i className="ri-error-warning-line text-red-500"></i>;
-                  } else if (isSuccess) {
-                    bgColor = 'bg-green-500/10 hover:bg-green-500/20';
-                    borderColor = 'border-green-500/30';
-                    icon = <i className="ri-checkbox-circle-line text-green-500"></i>;
-                  } else if (isWarning) {
-                    bgColor = 'bg-yellow-500/10 hover:bg-yellow-500/20';
-                    borderColor = 'border-yellow-500/30';
-                    icon = <i className="ri-alert-line text-yellow-500"></i>;
-                  }
+                  const { bgColor, borderColor, iconClass } = LOG_STYLES[getLogKind(log)];
 
                   return (
                     <div 
@@ -68,7 +87,7 @@ export function LogsPanel({ logs, logsEndRef }: LogsPanelProps) {
                       className={`p-3 rounded-lg border ${borderColor} ${bgColor} transition-colors duration-300`}
                     >
                       <div className="flex items-center gap-2">
-                        {icon && <span className="flex-shrink-0 leading-none">{icon}</span>}
+                        {iconClass && <span className="flex-shrink-0 leading-none"><i className={iconClass}></i></span>}
                         <span className="flex-1 leading-normal">{log}</span>
                       </div>
                     </div>
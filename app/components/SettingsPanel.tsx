@@ -13,19 +13,8 @@ import {
   SelectItem
 } from '@heroui/react';
 import { Dispatch, SetStateAction } from 'react';
-import { regions } from '../../config/config';
-
-// Type from parent component
-type GenerationOptions = {
-  mode: 'questions' | 'answers' | 'all';
-  region: string;
-  totalCount: number;
-  workerCount: number;
-  maxQPerWorker: number;
-  maxAttempts: number;
-  batchSize: number;
-  delay: number;
-};
+import { getRegionByName, regions } from '../../config/config';
+import type { GenerationMode, GenerationOptions } from '../../types/types';
 
 type SettingsPanelProps = {
   options: GenerationOptions;
@@ -67,7 +56,7 @@ export function SettingsPanel({
                   </label>
                   <RadioGroup
                     value={options.mode}
-                    onValueChange={(value) => setOptions({ ...options, mode: value as any })}
+                    onValueChange={(value) => setOptions({ ...options, mode: value as GenerationMode })}
                     className="flex flex-col gap-3"
                   >
                     <div className="grid grid-cols-1 gap-3">
@@ -130,7 +119,7 @@ export function SettingsPanel({
                   <Select
                     value={options.region}
                     onChange={(e) => {
-                      const selectedRegion = regions.find(r => r.name === e.target.value);
+                      const selectedRegion = getRegionByName(e.target.value);
                       if (selectedRegion) {
                         setOptions({ 
                           ...options, 
@@ -1,34 +1,21 @@
 'use client';
 
 import { useEffect, useRef, useState } from 'react';
-import { Region, regions } from '../config/config';
+import { defaultGenerationOptions, Region, regions } from '../config/config';
+import type { GenerationOptions } from '../types/types';
 import { AddRegionModal } from './components/AddRegionModal';
 import { LogsPanel } from './components/LogsPanel';
 import { NavbarComponent } from './components/Navbar';
 import { SettingsPanel } from './components/SettingsPanel';
 
-// Types from the original codebase
-type GenerationOptions = {
-  mode: 'questions' | 'answers' | 'all';
-  region: string;
-  totalCount: number;
-  workerCount: number;
-  maxQPerWorker: number;
-  maxAttempts: number;
-  batchSize: number;
-  delay: number;
-};
+// Maximum number of log lines kept in the panel; older lines are dropped first
+const MAX_LOG_LINES = 1000;
 
 export default function ControlPanel() {
   const [options, setOptions] = useState<GenerationOptions>({
     mode: 'all',
     region: regions.length > 0 ? regions[0].pinyin : '',
-    totalCount: 1000,
-    workerCount: 5,
-    maxQPerWorker: 50,
-    maxAttempts: 3,
-    batchSize: 50,
-    delay: 1000,
+    ...defaultGenerationOptions,
   });
 
   const [isRunning, setIsRunning] = useState(false);
@@ -42,6 +29,14 @@ export default function ControlPanel() {
   const logsEndRef = useRef<HTMLDivElement>(null);
   const processRef = useRef<AbortController | null>(null);
 
+  // Append log lines in a single state update, keeping only the most recent ones
+  const appendLogs = (...lines: string[]) => {
+    setLogs(prev => {
+      const next = [...prev, ...lines];
+      return next.length > MAX_LOG_LINES ? next.slice(next.length - MAX_LOG_LINES) : next;
+    });
+  };
+
   // Auto-scroll logs to bottom
   useEffect(() => {
     if (logsEndRef.current) {
@@ -82,8 +77,9 @@ export default function ControlPanel() {
         const { done, value } = await reader.read();
         
         if (done) {
-          if (buffer) {
-            processSSEData(buffer);
+          const line = buffer ? processSSEData(buffer) : null;
+          if (line) {
+            appendLogs(line);
           }
           break;
         }
@@ -92,46 +88,56 @@ export default function ControlPanel() {
         const messages = buffer.split('\n\n');
         buffer = messages.pop() || '';
 
+        // Collect every line in this chunk so the panel re-renders once per read
+        const lines: string[] = [];
         for (const message of messages) {
           if (message.trim()) {
-            processSSEData(message);
+            const line = processSSEData(message);
+            if (line) {
+              lines.push(line);
+            }
           }
         }
+        if (lines.length > 0) {
+          appendLogs(...lines);
+        }
       }
     } catch (error) {
       const message = error instanceof Error ? error.message : 'An unknown error occurred';
-      setLogs(prev => [...prev, `Error: ${message}`]);
+      appendLogs(`Error: ${message}`);
     } finally {
       setIsRunning(false);
     }
   };
 
-  const processSSEData = (message: string) => {
+  /**
+   * Parses one SSE message into the log line it should produce
+   * @returns Log line, or null if the message produces none
+   */
+  const processSSEData = (message: string): string | null => {
     if (message.startsWith('data: ')) {
       try {
         const data = JSON.parse(message.slice(6));
         switch (data.type) {
           case 'log':
-            setLogs(prev => [...prev, data.message.trim()]);
-            break;
+            return data.message.trim();
           case 'error':
-            setLogs(prev => [...prev, `Error: ${data.message.trim()}`]);
-            break;
+            return `Error: ${data.message.trim()}`;
           case 'end':
-            setLogs(prev => [...prev, `Process completed with code ${data.code}`]);
             setIsRunning(false);
-            break;
+            return `Process completed with code ${data.code}`;
         }
       } catch (error) {
         console.error('Error parsing SSE data:', error);
       }
     }
+    return null;
   };
 
   const handleStop = async () => {
     if (processRef.current) {
       processRef.current.abort();
-      setLogs(prev => [...prev, 'Stopping generation process...']);
+      appendLogs('Stopping generation process...');
       
       try {
         const response = await fetch('/api/generate/stop', {
@@ -142,10 +148,10 @@ export default function ControlPanel() {
           throw new Error('Failed to stop generation process');
         }
         
-        setLogs(prev => [...prev, 'Generation process stopped.']);
+        appendLogs('Generation process stopped.');
       } catch (error) {
         const message = error instanceof Error ? error.message : 'An unknown error occurred';
-        setLogs(prev => [...prev, `Error stopping process: ${message}`]);
+        appendLogs(`Error stopping process: ${message}`);
       } finally {
         setIsRunning(false);
       }
@@ -1,3 +1,5 @@
+import type { GenerationOptions } from '../types/types';
+
 // Region configuration for QA generation
 export interface Region {
   name: string;  // Region name in Chinese
@@ -21,18 +23,43 @@ export const regions: Region[] = [
 
 // Get region by pinyin
 export function getRegionByPinyin(pinyin: string): Region | undefined {
-  return regions.find(region => region.pinyin === pinyin);
+  return regionsByPinyin.get(pinyin);
 }
 
 // Get region by Chinese name
 export function getRegionByName(name: string): Region | undefined {
-  return regions.find(region => region.name === name);
+  return regionsByName.get(name);
+}
+
+// Index regions by a field, keeping the first region for duplicate keys
+function indexRegions(key: 'name' | 'pinyin'): Map<string, Region> {
+  const index = new Map<string, Region>();
+  for (const region of regions) {
+    if (!index.has(region[key])) {
+      index.set(region[key], region);
+    }
+  }
+  return index;
 }
 
+// Lookup tables built once from the regions list
+const regionsByPinyin = indexRegions('pinyin');
+const regionsByName = indexRegions('name');
+
 // Get file names for a region
 export function getRegionFileNames(pinyin: string): { questionFile: string; qaFile: string } {
   return {
     questionFile: `${pinyin}_q_results.json`,
     qaFile: `${pinyin}_qa_results.json`
   };
-} 
\ No newline at end of file
+}
+
+// Default settings for a generation run, shared by the CLI and the web UI
+export const defaultGenerationOptions: Readonly<Omit<GenerationOptions, 'mode' | 'region'>> = Object.freeze({
+  totalCount: 1000,
+  workerCount: 5,
+  maxQPerWorker: 50,
+  maxAttempts: 3,
+  batchSize: 50,
+  delay: 1000
+}); 
\ No newline at end of file
@@ -3,6 +3,7 @@ import { Groq } from 'groq-sdk';
 import { readFileSync, writeFileSync } from 'node:fs';
 import type { Region } from '../config/config';
 import { getRegionByPinyin, getRegionFileNames } from '../config/config';
+import { extractContent, extractJSONArray, extractThinkingContent } from '../utils/stream';
 
 // Load environment variables from .env file
 config();
@@ -38,55 +39,6 @@ async function collectStreamData(stream: AsyncIterable<any>): Promise<string> {
   return result;
 }
 
-// Function to extract thinking content
-function extractThinkingContent(text: string): string {
-  const thinkMatch = text.match(/<think>([\s\S]*?)<\/think>/);
-  let content = thinkMatch ? thinkMatch[1].trim() : '';
-  
-  // Limit thinking content to 1000 characters
-  return content.slice(0, 1000);
-}
-
-// Function to extract content excluding thinking content
-function extractContent(text: string): string {
-  // Remove thinking content
-  text = text.replace(/<think>[\s\S]*?<\/think>/g, '').trim();
-  
-  // Remove any repeated paragraphs (common in AI responses)
-  const paragraphs = text.split('\n\n');
-  const uniqueParagraphs = [...new Set(paragraphs)];
-  
-  // Join unique paragraphs and limit to reasonable length (about 2000 characters)
-  return uniqueParagraphs.join('\n\n').slice(0, 2000);
-}
-
-// Function to extract JSON array from the response
-function extractJSONArray(text: string): string {
-  // Remove any non-printable characters and normalize whitespace
-  text = text.replace(/[\x00-\x1F\x7F-\x9F]/g, '');
-  
-  // Find the outermost array containing questions
-  const match = text.match(/\[\s*\{[^]*\}\s*\]/);
-  if (!match) {
-    // Try to find any JSON array
-    const arrayMatch = text.match(/\[[^\]]*\]/);
-    if (!arrayMatch) return '';
-    return arrayMatch[0];
-  }
-  
-  // Clean up the JSON string
-  return match[0]
-    .replace(/[\u0000-\u0019]+/g, '') // Remove control characters
-    .replace(/。}/g, '}') // Remove Chinese period before closing brace
-    .replace(/。"/g, '"') // Remove Chinese period before quotes
-    .replace(/\s+/g, ' ') // Normalize whitespace
-    .replace(/,\s*]/g, ']') // Remove trailing commas
-    .replace(/,\s*,/g, ',') // Remove duplicate commas
-    .replace(/"\s*"/g, '","') // Fix adjacent quotes
-    .replace(/}\s*{/g, '},{') // Fix adjacent objects
-    .trim();
-}
-
 // Function to check if a question is similar to existing ones using basic text similarity
 function calculateSimilarity(str1: string, str2: string, regionName: string): number {
   // 移除地区前缀进行比较
@@ -1,11 +1,9 @@
 import { readFileSync, writeFileSync } from 'node:fs';
 import type { Region } from './config/config';
-import { getRegionByPinyin, getRegionFileNames } from './config/config';
-import { setupGroqEnvironment } from './providers/groq/client';
-import { groqService } from './providers/groq/service';
-import { setupQianFanEnvironment } from './providers/qianfan/client';
-import { qianfanService } from './providers/qianfan/service';
-import type { QAItem, Question } from './types/types';
+import { defaultGenerationOptions, getRegionByPinyin, getRegionFileNames } from './config/config';
+import { getAIService, getProviderName } from './providers';
+import type { GenerationMode, QAItem, Question } from './types/types';
+import { GENERATION_MODES } from './types/types';
 import type { AnswerWorkerTask, QuestionWorkerTask } from './types/worker';
 import Logger from './utils/logger';
 import { isTooSimilar } from './utils/similarity';
@@ -281,6 +279,9 @@ async function main_questions_parallel(
       Logger.info('No existing questions found, starting fresh');
     }
 
+    // Built once and kept in step with allQuestions across batches
+    const existingSet = new Set(allQuestions.map(q => q.question));
+
     // Keep generating until we reach the target or max retries
     while (allQuestions.length < totalQuestionCount && retryCount < maxRetries) {
       if (retryCount > 0) {
@@ -308,7 +309,6 @@ async function main_questions_parallel(
       
       // Process new questions
       const newQuestions = results.flat();
-      const existingSet = new Set(allQuestions.map(q => q.question));
       let newAddedCount = 0;
       
       // Add new unique questions
@@ -320,7 +320,7 @@ async function main_questions_parallel(
           continue;
         }
 
-        if (!existingSet.has(q.question) && !isTooSimilar(q.question, Array.from(existingSet), region.name)) {
+        if (!existingSet.has(q.question) && !isTooSimilar(q.question, existingSet, region.name)) {
           allQuestions.push({ ...q, is_answered: false });
           existingSet.add(q.question);
           newAddedCount++;
@@ -399,16 +399,33 @@ async function main_answers_parallel(
   const answeredQuestions = new Set(existingAnswers.map(item => item.question));
   
   // Update questions status based on existing answers
+  let statusChanged = false;
   questions.forEach(q => {
-    q.is_answered = answeredQuestions.has(q.question);
+    const isAnswered = answeredQuestions.has(q.question);
+    if (q.is_answered !== isAnswered) {
+      q.is_answered = isAnswered;
+      statusChanged = true;
+    }
   });
   
-  Logger.process('Writing updated question status to file...');
-  try {
-    writeFileSync(questionFile, JSON.stringify(questions, null, 2), 'utf-8');
-    Logger.success('Successfully updated question file');
-  } catch (error) {
-    Logger.error('Error updating question file', error);
+  // Only rewrite the question file when a status actually changed
+  if (statusChanged) {
+    Logger.process('Writing updated question status to file...');
+    try {
+      writeFileSync(questionFile, JSON.stringify(questions, null, 2), 'utf-8');
+      Logger.success('Successfully updated question file');
+    } catch (error) {
+      Logger.error('Error updating question file', error);
+    }
+  }
+
+  // Index questions by text so answered results can be marked in O(1),
+  // keeping the first question for duplicate texts as findIndex did
+  const questionsByText = new Map<string, Question>();
+  for (const q of questions) {
+    if (!questionsByText.has(q.question)) {
+      questionsByText.set(q.question, q);
+    }
   }
 
   // Get unanswered questions
@@ -417,6 +434,7 @@ async function main_answers_parallel(
 
   if (unansweredQuestions.length === 0) {
     Logger.info('No unanswered questions found, nothing to do');
+    answerPool.terminate();
     return existingAnswers;
   }
 
@@ -489,9 +507,9 @@ async function main_answers_parallel(
             answeredQuestions.add(result.question);
             
             // Update question status
-            const questionIndex = questions.findIndex(q => q.question === result.question);
-            if (questionIndex !== -1) {
-              questions[questionIndex].is_answered = true;
+            const answeredQuestion = questionsByText.get(result.question);
+            if (answeredQuestion) {
+              answeredQuestion.is_answered = true;
             }
           }
         }
@@ -543,19 +561,14 @@ async function main_answers_parallel(
  * Main application entry point
  */
 async function main() {
-  const provider = process.env.AI_PROVIDER?.toLowerCase() || 'qianfan';
+  const provider = getProviderName();
   
   // Parse command line arguments
   const args = process.argv.slice(2);
   let options = {
-    mode: '',
+    mode: '' as GenerationMode | '',
     region: '',
-    totalCount: 1000,    // Changed from perWorkerCount to totalCount
-    workerCount: 5,
-    maxQPerWorker: 50,    // Renamed from maxPerWorker
-    maxAttempts: 3,
-    batchSize: 50,
-    delay: 1000,
+    ...defaultGenerationOptions
   };
 
   // Parse named arguments
@@ -570,11 +583,11 @@ async function main() {
 
     switch (key) {
       case 'mode':
-        if (!['questions', 'answers', 'all'].includes(value)) {
-          Logger.error('Error: Invalid mode. Must be one of: questions, answers, all');
+        if (!(GENERATION_MODES as readonly string[]).includes(value)) {
+          Logger.error(`Error: Invalid mode. Must be one of: ${GENERATION_MODES.join(', ')}`);
           process.exit(1);
         }
-        options.mode = value;
+        options.mode = value as GenerationMode;
         break;
       case 'region':
         options.region = value;
@@ -644,12 +657,12 @@ async function main() {
     Logger.error('  --region <name>  Region name in pinyin');
     Logger.error('');
     Logger.error('Optional:');
-    Logger.error('  --count <number>            Total questions to generate (default: 1000)');
-    Logger.error('  --workers <number>          Number of worker threads (default: 5)');
-    Logger.error('  --max-q-per-worker <number> Maximum questions per worker (default: 50)');
-    Logger.error('  --attempts <number>         Maximum retry attempts (default: 3)');
-    Logger.error('  --batch <number>            Batch size for processing (default: 50)');
-    Logger.error('  --delay <number>            Delay between batches in ms (default: 1000)');
+    Logger.error(`  --count <number>            Total questions to generate (default: ${defaultGenerationOptions.totalCount})`);
+    Logger.error(`  --workers <number>          Number of worker threads (default: ${defaultGenerationOptions.workerCount})`);
+    Logger.error(`  --max-q-per-worker <number> Maximum questions per worker (default: ${defaultGenerationOptions.maxQPerWorker})`);
+    Logger.error(`  --attempts <number>         Maximum retry attempts (default: ${defaultGenerationOptions.maxAttempts})`);
+    Logger.error(`  --batch <number>            Batch size for processing (default: ${defaultGenerationOptions.batchSize})`);
+    Logger.error(`  --delay <number>            Delay between batches in ms (default: ${defaultGenerationOptions.delay})`);
     process.exit(1);
   }
 
@@ -664,30 +677,18 @@ async function main() {
 
   // Setup provider environment
   try {
-    switch (provider) {
-      case 'qianfan':
-        setupQianFanEnvironment();
-        break;
-      case 'groq':
-        setupGroqEnvironment();
-        break;
-      default:
-        throw new Error(`Unsupported AI provider: ${provider}`);
-    }
+    getAIService();
   } catch (error) {
     Logger.error(`Failed to setup ${provider} environment`, error);
     process.exit(1);
   }
 
-  // Select provider functions
-  const { generateAnswer, generateQuestionsFromPrompt } = provider === 'groq' 
-    ? { generateAnswer: groqService.generateAnswer.bind(groqService), generateQuestionsFromPrompt: groqService.generateQuestionsFromPrompt.bind(groqService) }
-    : { generateAnswer: qianfanService.generateAnswer.bind(qianfanService), generateQuestionsFromPrompt: qianfanService.generateQuestionsFromPrompt.bind(qianfanService) };
-
   // Execute requested mode
   try {
     let questions: Question[] = [];
     let answers: QAItem[] = [];
+    // Whether `answers` mirrors the QA file, so the final status can skip re-reading it
+    let answersLoaded = false;
     
     // Handle question generation
     if (options.mode === 'questions' || options.mode === 'all') {
@@ -744,6 +745,7 @@ async function main() {
           },
           options.region
         );
+        answersLoaded = true;
 
         // Calculate final statistics
         const answeredAfter = answers.length;
@@ -761,11 +763,15 @@ async function main() {
 
     // Final summary for 'all' mode
     if (options.mode === 'all') {
-      const { questionFile, qaFile } = getRegionFileNames(region.pinyin);
+      const { qaFile } = getRegionFileNames(region.pinyin);
       Logger.info('\n=== Final Status ===');
       try {
-        const finalQuestions = JSON.parse(readFileSync(questionFile, 'utf-8')) as Question[];
-        const finalAnswers = JSON.parse(readFileSync(qaFile, 'utf-8')) as QAItem[];
+        // Both phases have just written these files from the in-memory lists;
+        // only read the QA file when answer generation was skipped
+        const finalQuestions = questions;
+        const finalAnswers = answersLoaded
+          ? answers
+          : JSON.parse(readFileSync(qaFile, 'utf-8')) as QAItem[];
         
         Logger.info(`Questions:`);
         Logger.info(`- Total in file: ${finalQuestions.length}`);
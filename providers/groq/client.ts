@@ -19,13 +19,20 @@ export function setupGroqEnvironment() {
 
 // MARK: - Core Client
 class GroqClient implements AIProviderClient {
-  private client: Groq;
+  private client?: Groq;
   private defaultModel = 'deepseek-r1-distill-llama-70b';
 
-  constructor() {
-    this.client = new Groq({
-      apiKey: process.env.GROQ_API_KEY,
-    });
+  /**
+   * Creates the SDK client on first use so importing this module never
+   * requires GROQ_API_KEY unless Groq is actually the selected provider
+   */
+  private getClient(): Groq {
+    if (!this.client) {
+      this.client = new Groq({
+        apiKey: process.env.GROQ_API_KEY,
+      });
+    }
+    return this.client;
   }
 
   async chat(params: {
@@ -35,7 +42,7 @@ class GroqClient implements AIProviderClient {
     maxTokens?: number;
     topP?: number;
   }, model?: string) {
-    return this.client.chat.completions.create({
+    return this.getClient().chat.completions.create({
       messages: params.messages,
       model: model || this.defaultModel,
       temperature: params.temperature || 0.6,
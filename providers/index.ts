@@ -0,0 +1,44 @@
+import type { AIProviderService } from '../types/provider';
+import { setupGroqEnvironment } from './groq/client';
+import { groqService } from './groq/service';
+import { setupQianFanEnvironment } from './qianfan/client';
+import { qianfanService } from './qianfan/service';
+
+// MARK: - Provider Selection
+/**
+ * Gets the AI provider name selected through the AI_PROVIDER environment variable
+ * @returns Lower-cased provider name, defaulting to qianfan
+ */
+export function getProviderName(): string {
+  return process.env.AI_PROVIDER?.toLowerCase() || 'qianfan';
+}
+
+let cachedService: AIProviderService | undefined;
+
+/**
+ * Resolves the service for the selected provider, validating its environment
+ * on the first call and returning the same instance afterwards
+ * @returns AI provider service
+ * @throws {Error} If the provider is unsupported or its credentials are missing
+ */
+export function getAIService(): AIProviderService {
+  if (cachedService) {
+    return cachedService;
+  }
+
+  const provider = getProviderName();
+  switch (provider) {
+    case 'qianfan':
+      setupQianFanEnvironment();
+      cachedService = qianfanService;
+      break;
+    case 'groq':
+      setupGroqEnvironment();
+      cachedService = groqService;
+      break;
+    default:
+      throw new Error(`Unsupported AI provider: ${provider}`);
+  }
+
+  return cachedService;
+}
@@ -1,5 +1,6 @@
 import { ChatCompletion, setEnvVariable } from '@baiducloud/qianfan';
 import { config } from 'dotenv';
+import type { AIProviderClient } from '../../types/provider';
 
 // Load environment variables from .env file
 config();
@@ -19,9 +20,28 @@ export function setupQianFanEnvironment() {
 }
 
 // MARK: - Core Client
-export const qianfanClient = new ChatCompletion({
-  ENABLE_OAUTH: true,
-  QIANFAN_ACCESS_KEY: process.env.QIANFAN_ACCESS_KEY,
-  QIANFAN_SECRET_KEY: process.env.QIANFAN_SECRET_KEY,
-  version: 'v2',
-}); 
\ No newline at end of file
+class QianFanClient implements AIProviderClient {
+  private client?: ChatCompletion;
+
+  /**
+   * Creates the SDK client on first use so credentials are read after
+   * setupQianFanEnvironment() has run, and not at all for other providers
+   */
+  private getClient(): ChatCompletion {
+    if (!this.client) {
+      this.client = new ChatCompletion({
+        ENABLE_OAUTH: true,
+        QIANFAN_ACCESS_KEY: process.env.QIANFAN_ACCESS_KEY,
+        QIANFAN_SECRET_KEY: process.env.QIANFAN_SECRET_KEY,
+        version: 'v2',
+      });
+    }
+    return this.client;
+  }
+
+  async chat(params: Parameters<ChatCompletion['chat']>[0], model?: string) {
+    return this.getClient().chat(params, model);
+  }
+}
+
+export const qianfanClient = new QianFanClient(); 
\ No newline at end of file
@@ -13,4 +13,28 @@ export interface QAItem {
   question: string;
   reasoning_content: string;
   content: string;
+}
+
+/**
+ * Supported generation modes
+ */
+export const GENERATION_MODES = ['questions', 'answers', 'all'] as const;
+
+/**
+ * Generation mode selecting which pipeline phases run
+ */
+export type GenerationMode = typeof GENERATION_MODES[number];
+
+/**
+ * Options for a generation run, shared by the web UI and the generate API
+ */
+export interface GenerationOptions {
+  mode: GenerationMode;
+  region: string;
+  totalCount: number;
+  workerCount: number;
+  maxQPerWorker: number;
+  maxAttempts: number;
+  batchSize: number;
+  delay: number;
 } 
\ No newline at end of file
@@ -17,6 +17,26 @@ interface LoggerConfig {
   showTimestamp: boolean;
   showLevel: boolean;
   showEmoji: boolean;
+  minLevel: LogLevel;
+}
+
+/**
+ * Severity order of log levels, lowest first
+ */
+const LEVEL_PRIORITY: Readonly<Record<LogLevel, number>> = Object.freeze({
+  [LogLevel.DEBUG]: 0,
+  [LogLevel.INFO]: 1,
+  [LogLevel.WARN]: 2,
+  [LogLevel.ERROR]: 3
+});
+
+/**
+ * Resolve the minimum log level from the LOG_LEVEL environment variable
+ * @returns Minimum log level, defaulting to DEBUG
+ */
+function getEnvLogLevel(): LogLevel {
+  const level = process.env.LOG_LEVEL?.toUpperCase();
+  return level && level in LEVEL_PRIORITY ? level as LogLevel : LogLevel.DEBUG;
 }
 
 /**
@@ -25,7 +45,8 @@ interface LoggerConfig {
 const defaultConfig: LoggerConfig = {
   showTimestamp: true,
   showLevel: true,
-  showEmoji: true
+  showEmoji: true,
+  minLevel: getEnvLogLevel()
 };
 
 /**
@@ -44,6 +65,16 @@ const EMOJI = {
   PROCESS: '⚙️'
 };
 
+/**
+ * Color mappings for different log levels
+ */
+const LEVEL_COLORS: Readonly<Record<LogLevel, (text: string) => string>> = Object.freeze({
+  [LogLevel.DEBUG]: chalk.blue,
+  [LogLevel.INFO]: chalk.green,
+  [LogLevel.WARN]: chalk.yellow,
+  [LogLevel.ERROR]: chalk.red
+});
+
 /**
  * Logger class for standardized logging across the application
  */
@@ -65,6 +96,13 @@ export class Logger {
     Logger.workerId = String(id);
   }
 
+  /**
+   * Check whether messages at a level pass the configured minimum level
+   */
+  private static isEnabled(level: LogLevel): boolean {
+    return LEVEL_PRIORITY[level] >= LEVEL_PRIORITY[Logger.config.minLevel];
+  }
+
   /**
    * Format log message with timestamp, level, and context
    */
@@ -76,13 +114,7 @@ export class Logger {
     }
     
     if (Logger.config.showLevel) {
-      const levelColor = {
-        [LogLevel.DEBUG]: chalk.blue,
-        [LogLevel.INFO]: chalk.green,
-        [LogLevel.WARN]: chalk.yellow,
-        [LogLevel.ERROR]: chalk.red
-      }[level];
-      parts.push(levelColor(level.padEnd(5)));
+      parts.push(LEVEL_COLORS[level](level.padEnd(5)));
     }
     
     if (Logger.workerId) {
@@ -125,19 +157,24 @@ export class Logger {
   }
 
   // Basic logging methods
+  // Disabled levels return before any stringifying or formatting work
   static debug(message: unknown, emoji = EMOJI.DEBUG) {
+    if (!Logger.isEnabled(LogLevel.DEBUG)) return;
     console.debug(Logger.format(LogLevel.DEBUG, Logger.stringify(message), emoji));
   }
 
   static info(message: unknown, emoji = EMOJI.INFO) {
+    if (!Logger.isEnabled(LogLevel.INFO)) return;
     console.info(Logger.format(LogLevel.INFO, Logger.stringify(message), emoji));
   }
 
   static warn(message: unknown, emoji = EMOJI.WARN) {
+    if (!Logger.isEnabled(LogLevel.WARN)) return;
     console.warn(Logger.format(LogLevel.WARN, Logger.stringify(message), emoji));
   }
 
   static error(message: unknown, error?: unknown, emoji = EMOJI.ERROR) {
+    if (!Logger.isEnabled(LogLevel.ERROR)) return;
     console.error(Logger.format(LogLevel.ERROR, Logger.formatError(message, error), emoji));
   }
 
@@ -151,6 +188,7 @@ export class Logger {
   }
 
   static progress(current: number, total: number, message?: string) {
+    if (!Logger.isEnabled(LogLevel.INFO)) return;
     const percentage = Math.round((current / total) * 100);
     const progressBar = this.createProgressBar(percentage);
     Logger.info(`${progressBar} ${percentage}% ${message || ''}`, EMOJI.PROGRESS);
@@ -1,42 +1,31 @@
+import { basePromptTemplate } from '../prompts/base';
+
 /**
  * Generates a question prompt for a specific region
  */
 export function generateQuestionPrompt(regionName: string, batchSize: number): string {
-  return `作为一个本地文化专家，请生成${batchSize}个关于${regionName}的高质量问题。
-
-要求：
-1. 每行一个问题，每个问题独占一行
-2. 每个问题必须以"${regionName}本地"开头
-3. 问题要具体且有深度
-4. 问题必须以问号"？"结尾
-5. 不要输出任何其他内容，比如序号、解释、标点符号等
-6. 不要使用任何JSON或其他格式，直接输出问题文本
-7. 不要输出思考过程，直接输出问题列表
-
-涵盖以下领域（每个领域的问题数量要均衡）：
-- 历史文化：历史事件、文化遗产、名人轶事
-- 美食特产：地方小吃、特色菜系、农产品
-- 景点名胜：著名景区、历史建筑、特色街区
-- 现代发展：产业特色、城市建设、经济发展
-- 民俗风情：地方习俗、节日活动、方言特色
-- 生活服务：休闲娱乐、教育医疗、交通出行
-
-输出格式示例（每行一个问题，不要有空行）：
-${regionName}本地最古老的寺庙是哪座建于何时？
-${regionName}本地有哪些百年老字号还在经营？
-${regionName}本地的丝绸产业发展历史可以追溯到什么时候？
+  return basePromptTemplate.questionPrompt(regionName, batchSize);
+}
 
-直接开始输出问题，不要有任何开场白或结束语。`;
+/**
+ * Writes a buffered processing report to the console in a single call
+ */
+function flushReport(report: string[]): void {
+  console.log(report.join('\n'));
 }
 
 /**
  * Processes raw API response into structured question format
  */
 export function processQuestionResponse(text: string, regionName: string): string {
-  console.log('\n🔍 Processing Response');
-  console.log('├── Input Length:', text.length);
-  console.log('└── Input Preview:', text.slice(0, 100).replace(/\n/g, '\\n') + (text.length > 100 ? '...' : ''));
-  
+  // Collect the report and write it once instead of logging line by line
+  const report: string[] = [
+    '\n🔍 Processing Response',
+    `├── Input Length: ${text.length}`,
+    `└── Input Preview: ${text.slice(0, 100).replace(/\n/g, '\\n')}${text.length > 100 ? '...' : ''}`
+  ];
+  const prefix = `${regionName}本地`;
+
   // Try to extract JSON array first
   try {
     const jsonMatch = text.match(/\[[\s\S]*\]/);
@@ -44,78 +33,76 @@ export function processQuestionResponse(text: string, regionName: string): strin
       const jsonStr = jsonMatch[0];
       const parsed = JSON.parse(jsonStr);
       if (Array.isArray(parsed)) {
-        console.log('Found valid JSON array in response');
+        report.push('Found valid JSON array in response');
         const validQuestions = parsed
           .filter(q => q && typeof q === 'object' && typeof q.question === 'string')
           .map(q => ({
             question: q.question.trim(),
             is_answered: false
           }))
-          .filter(q => q.question.startsWith(`${regionName}本地`) && q.question.length >= 10);
-        
+          .filter(q => q.question.startsWith(prefix) && q.question.length >= 10);
+
         if (validQuestions.length > 0) {
           const result = JSON.stringify(validQuestions, null, 2);
-          console.log(`\n✅ Processed ${validQuestions.length} valid questions from JSON`);
+          report.push(`\n✅ Processed ${validQuestions.length} valid questions from JSON`);
+          flushReport(report);
           return result;
         }
       }
     }
   } catch (error) {
-    console.log('Failed to process as JSON, falling back to text processing');
+    report.push('Failed to process as JSON, falling back to text processing');
   }
 
   // Split into lines and clean up
   const lines = text.split(/[\n\r]+/).map(line => line.trim());
-  console.log('\n📝 Line Processing');
-  console.log(`└── Found ${lines.length} lines`);
+  report.push('\n📝 Line Processing', `└── Found ${lines.length} lines`);
 
   // Process each line
-  console.log('\n🔄 Question Processing');
+  report.push('\n🔄 Question Processing');
+  const seen = new Set<string>();
   const questions = lines
     .filter(line => {
-      const isValid = line && 
-                     line.startsWith(`${regionName}本地`) && 
+      const isValid = line &&
+                     line.startsWith(prefix) &&
                      (line.includes('？') || line.includes('?')) &&
                      line.length >= 10;
       if (!isValid && line.length > 0) {
-        console.log('├── Filtered:', '❌');
-        console.log('│   └── Invalid:', line);
+        report.push('├── Filtered: ❌', `│   └── Invalid: ${line}`);
       }
       return isValid;
     })
     .map(line => {
-      console.log('├── Processing:', '📝');
-      console.log('│   └── Question:', line);
-      
+      report.push('├── Processing: 📝', `│   └── Question: ${line}`);
+
       // Ensure question ends with proper question mark
       const formatted = !line.endsWith('？') && !line.endsWith('?') ? line + '？' : line;
       if (formatted !== line) {
-        console.log('├── Formatted:', '✍️');
-        console.log('│   └── Added question mark');
+        report.push('├── Formatted: ✍️', '│   └── Added question mark');
       }
       return formatted;
     })
-    .filter((line, index, self) => {
-      const isUnique = self.indexOf(line) === index;
+    .filter(line => {
+      // Keep the first occurrence, like indexOf, without rescanning the list
+      const isUnique = !seen.has(line);
+      seen.add(line);
       if (!isUnique) {
-        console.log('├── Duplicate:', '🔄');
-        console.log('│   └── Removed:', line);
+        report.push('├── Duplicate: 🔄', `│   └── Removed: ${line}`);
       }
       return isUnique;
     });
 
-  console.log('\n✅ Processing Complete');
-  console.log(`└── Generated ${questions.length} valid questions`);
+  report.push('\n✅ Processing Complete', `└── Generated ${questions.length} valid questions`);
 
   // Create final JSON structure
   const jsonQuestions = questions.map(q => ({
     question: q.trim(),
     is_answered: false
   }));
-  
+
   const result = JSON.stringify(jsonQuestions, null, 2);
-  console.log('\n📤 Final Output Preview:');
-  console.log(result.slice(0, 200) + (result.length > 200 ? '...' : ''));
-  
+  report.push('\n📤 Final Output Preview:', result.slice(0, 200) + (result.length > 200 ? '...' : ''));
+  flushReport(report);
+
   return result;
 } 
\ No newline at end of file
@@ -6,11 +6,52 @@
 import { Jieba } from '@node-rs/jieba';
 import { dict } from '@node-rs/jieba/dict';
 
-// Cache for segmented words to improve performance
-const segmentationCache = new Map<string, string[]>();
+// Weights for combining the similarity metrics
+// Levenshtein: 30% - Good for character-level differences
+// Jaccard: 30% - Good for word overlap
+// Cosine: 40% - Good for semantic similarity with word frequencies
+const SIMILARITY_WEIGHTS = Object.freeze({
+  levenshtein: 0.3,
+  jaccard: 0.3,
+  cosine: 0.4
+});
 
-const jieba = Jieba.withDict(dict)
+// Similarity above which a question counts as a duplicate
+const BASE_SIMILARITY_THRESHOLD = 0.6;
 
+// Questions with more words than this use a slightly lower threshold
+const LONG_QUESTION_WORDS = 10;
+const LONG_QUESTION_THRESHOLD_FACTOR = 0.9;
+
+let jieba: Jieba | undefined;
+
+/**
+ * Get the shared Jieba segmenter, loading its dictionary on first use
+ * @returns Jieba instance
+ */
+function getJieba(): Jieba {
+  if (!jieba) {
+    jieba = Jieba.withDict(dict);
+  }
+  return jieba;
+}
+
+// Cache for compiled region prefix patterns, one per region
+const regionPrefixCache = new Map<string, RegExp>();
+
+/**
+ * Get the compiled "<region>本地" prefix pattern for a region
+ * @param regionName - Region name
+ * @returns Prefix pattern
+ */
+function getRegionPrefix(regionName: string): RegExp {
+  let prefix = regionPrefixCache.get(regionName);
+  if (!prefix) {
+    prefix = new RegExp(`^${regionName}本地`);
+    regionPrefixCache.set(regionName, prefix);
+  }
+  return prefix;
+}
 
 /**
  * Text preprocessing and normalization
@@ -20,7 +61,7 @@ const jieba = Jieba.withDict(dict)
  */
 function normalizeText(text: string, regionName: string): string {
   return text
-    .replace(new RegExp(`^${regionName}本地`), '')
+    .replace(getRegionPrefix(regionName), '')
     .trim()
     .toLowerCase()
     .replace(/[,.，。？?！!]/g, ' ')
@@ -28,19 +69,44 @@ function normalizeText(text: string, regionName: string): string {
 }
 
 /**
- * Get segmented words with caching
- * @param text - Input text
- * @returns Array of words
+ * Precomputed per-question data consumed by the similarity metrics
  */
-function getSegmentedWords(text: string): string[] {
+interface QuestionFeatures {
+  normalized: string;
+  words: string[];
+  wordSet: Set<string>;
+  wordFreq: Map<string, number>;
+}
 
-  
-  if (segmentationCache.has(text)) {
-    return segmentationCache.get(text)!;
+// Cache for question features, keyed by region name and then raw question text
+// Left unbounded: isTooSimilar rereads every known question on each call,
+// and the cache only lives for one CLI run
+const featureCache = new Map<string, Map<string, QuestionFeatures>>();
+
+/**
+ * Get normalized text, segmented words and word statistics for a question,
+ * computed once per question instead of once per comparison
+ * @param text - Raw question text
+ * @param regionName - Region name for context
+ * @returns Question features
+ */
+function getQuestionFeatures(text: string, regionName: string): QuestionFeatures {
+  let regionFeatures = featureCache.get(regionName);
+  if (!regionFeatures) {
+    regionFeatures = new Map();
+    featureCache.set(regionName, regionFeatures);
+  }
+
+  let features = regionFeatures.get(text);
+  if (!features) {
+    const normalized = normalizeText(text, regionName);
+    const words = getJieba().cut(normalized);
+    const wordFreq = new Map<string, number>();
+    words.forEach(word => wordFreq.set(word, (wordFreq.get(word) || 0) + 1));
+    features = { normalized, words, wordSet: new Set(words), wordFreq };
+    regionFeatures.set(text, features);
   }
-  const words = jieba.cut(text);
-  segmentationCache.set(text, words);
-  return words;
+  return features;
 }
 
 /**
@@ -53,24 +119,29 @@ function levenshteinDistance(a: string, b: string): number {
   if (a.length === 0) return b.length;
   if (b.length === 0) return a.length;
 
-  const matrix = Array(b.length + 1).fill(null).map(() => Array(a.length + 1).fill(null));
+  // Each row only depends on the previous one, so keep two typed rows
+  // instead of allocating the full (b + 1) x (a + 1) matrix
+  let previous = new Uint32Array(a.length + 1);
+  let current = new Uint32Array(a.length + 1);
   
-  for (let i = 0; i <= b.length; i++) matrix[i][0] = i;
-  for (let j = 0; j <= a.length; j++) matrix[0][j] = j;
+  for (let j = 0; j <= a.length; j++) previous[j] = j;
   
   for (let i = 1; i <= b.length; i++) {
+    current[0] = i;
+    const bChar = b.charCodeAt(i - 1);
     for (let j = 1; j <= a.length; j++) {
-      matrix[i][j] = b.charAt(i - 1) === a.charAt(j - 1)
-        ? matrix[i - 1][j - 1]
+      current[j] = bChar === a.charCodeAt(j - 1)
+        ? previous[j - 1]
         : Math.min(
-            matrix[i - 1][j - 1] + 1,
-            matrix[i][j - 1] + 1,
-            matrix[i - 1][j] + 1
+            previous[j - 1] + 1,
+            current[j - 1] + 1,
+            previous[j] + 1
           );
     }
+    [previous, current] = [current, previous];
   }
   
-  return matrix[b.length][a.length];
+  return previous[a.length];
 }
 
 /**
@@ -80,48 +151,76 @@ function levenshteinDistance(a: string, b: string): number {
  * @returns Jaccard similarity score
  */
 function jaccardSimilarity(words1: Set<string>, words2: Set<string>): number {
-  const intersection = new Set([...words1].filter(x => words2.has(x)));
-  const union = new Set([...words1, ...words2]);
-  return intersection.size / union.size;
+  // Count the intersection over the smaller set and derive the union size,
+  // instead of materializing both sets
+  const [smaller, larger] = words1.size <= words2.size ? [words1, words2] : [words2, words1];
+  let intersectionSize = 0;
+  smaller.forEach(word => {
+    if (larger.has(word)) intersectionSize++;
+  });
+  return intersectionSize / (words1.size + words2.size - intersectionSize);
 }
 
 /**
  * Calculate cosine similarity between word frequency vectors
- * @param words1 - First array of words
- * @param words2 - Second array of words
+ * @param freq1 - Word frequencies of the first text
+ * @param freq2 - Word frequencies of the second text
  * @returns Cosine similarity score
  */
-function cosineSimilarity(words1: string[], words2: string[]): number {
-  // Create word frequency maps
-  const freq1 = new Map<string, number>();
-  const freq2 = new Map<string, number>();
-  
-  words1.forEach(word => freq1.set(word, (freq1.get(word) || 0) + 1));
-  words2.forEach(word => freq2.set(word, (freq2.get(word) || 0) + 1));
-  
-  // Get all unique words
-  const allWords = new Set([...freq1.keys(), ...freq2.keys()]);
-  
-  // Calculate dot product and magnitudes
+function cosineSimilarity(freq1: Map<string, number>, freq2: Map<string, number>): number {
+  // Words missing from either side add nothing to the dot product,
+  // so only the smaller map needs to be walked
+  const [smaller, larger] = freq1.size <= freq2.size ? [freq1, freq2] : [freq2, freq1];
   let dotProduct = 0;
-  let magnitude1 = 0;
-  let magnitude2 = 0;
-  
-  allWords.forEach(word => {
-    const f1 = freq1.get(word) || 0;
-    const f2 = freq2.get(word) || 0;
-    dotProduct += f1 * f2;
-    magnitude1 += f1 * f1;
-    magnitude2 += f2 * f2;
+  smaller.forEach((count, word) => {
+    dotProduct += count * (larger.get(word) || 0);
   });
   
-  magnitude1 = Math.sqrt(magnitude1);
-  magnitude2 = Math.sqrt(magnitude2);
+  const magnitude1 = vectorMagnitude(freq1);
+  const magnitude2 = vectorMagnitude(freq2);
   
   if (magnitude1 === 0 || magnitude2 === 0) return 0;
   return dotProduct / (magnitude1 * magnitude2);
 }
 
+/**
+ * Calculate the Euclidean magnitude of a word frequency vector
+ * @param freq - Word frequencies
+ * @returns Vector magnitude
+ */
+function vectorMagnitude(freq: Map<string, number>): number {
+  let sumOfSquares = 0;
+  freq.forEach(count => {
+    sumOfSquares += count * count;
+  });
+  return Math.sqrt(sumOfSquares);
+}
+
+/**
+ * Calculate Levenshtein-based similarity between two normalized texts
+ * @param s1 - First normalized text
+ * @param s2 - Second normalized text
+ * @returns Similarity score between 0 and 1
+ */
+function levenshteinSimilarity(s1: string, s2: string): number {
+  const distance = levenshteinDistance(s1, s2);
+  const maxLength = Math.max(s1.length, s2.length);
+  return 1 - (distance / maxLength);
+}
+
+/**
+ * Combine the individual metric scores into one weighted score
+ * @param levenshteinScore - Character-level similarity
+ * @param jaccardScore - Word overlap similarity
+ * @param cosineScore - Word frequency similarity
+ * @returns Weighted similarity score
+ */
+function combineScores(levenshteinScore: number, jaccardScore: number, cosineScore: number): number {
+  return levenshteinScore * SIMILARITY_WEIGHTS.levenshtein
+    + jaccardScore * SIMILARITY_WEIGHTS.jaccard
+    + cosineScore * SIMILARITY_WEIGHTS.cosine;
+}
+
 /**
  * Calculate weighted similarity score between two questions
  * @param str1 - First question
@@ -130,51 +229,47 @@ function cosineSimilarity(words1: string[], words2: string[]): number {
  * @returns Similarity score between 0 and 1
  */
 export function calculateSimilarity(str1: string, str2: string, regionName: string): number {
-  // Normalize texts
-  const s1 = normalizeText(str1, regionName);
-  const s2 = normalizeText(str2, regionName);
-  
-  // Get segmented words
-  const words1 = getSegmentedWords(s1);
-  const words2 = getSegmentedWords(s2);
-  
-  // Calculate Levenshtein-based similarity
-  const distance = levenshteinDistance(s1, s2);
-  const maxLength = Math.max(s1.length, s2.length);
-  const levenshteinScore = 1 - (distance / maxLength);
-  
-  // Calculate Jaccard similarity
-  const wordSet1 = new Set(words1);
-  const wordSet2 = new Set(words2);
-  const jaccardScore = jaccardSimilarity(wordSet1, wordSet2);
+  // Normalized texts and segmented words
+  const features1 = getQuestionFeatures(str1, regionName);
+  const features2 = getQuestionFeatures(str2, regionName);
   
-  // Calculate cosine similarity
-  const cosineScore = cosineSimilarity(words1, words2);
-  
-  // Weighted combination of scores
-  // Levenshtein: 30% - Good for character-level differences
-  // Jaccard: 30% - Good for word overlap
-  // Cosine: 40% - Good for semantic similarity with word frequencies
-  return levenshteinScore * 0.3 + jaccardScore * 0.3 + cosineScore * 0.4;
+  return combineScores(
+    levenshteinSimilarity(features1.normalized, features2.normalized),
+    jaccardSimilarity(features1.wordSet, features2.wordSet),
+    cosineSimilarity(features1.wordFreq, features2.wordFreq)
+  );
 }
 
 /**
  * Check if a question is too similar to existing ones
  * @param newQuestion - Question to check
- * @param existingQuestions - Array of existing questions
+ * @param existingQuestions - Existing questions, iterated as-is without copying
  * @param regionName - Region name for context
  * @returns boolean indicating if question is too similar
  */
-export function isTooSimilar(newQuestion: string, existingQuestions: string[], regionName: string): boolean {
-  // Adjust threshold based on question length
-  const baseThreshold = 0.6;
-  const normalizedQuestion = normalizeText(newQuestion, regionName);
-  const questionLength = getSegmentedWords(normalizedQuestion).length;
+export function isTooSimilar(newQuestion: string, existingQuestions: Iterable<string>, regionName: string): boolean {
+  const features = getQuestionFeatures(newQuestion, regionName);
   
   // Slightly lower threshold for longer questions
-  const threshold = questionLength > 10 ? baseThreshold * 0.9 : baseThreshold;
+  const threshold = features.words.length > LONG_QUESTION_WORDS
+    ? BASE_SIMILARITY_THRESHOLD * LONG_QUESTION_THRESHOLD_FACTOR
+    : BASE_SIMILARITY_THRESHOLD;
   
-  return existingQuestions.some(existing => 
-    calculateSimilarity(newQuestion, existing, regionName) > threshold
-  );
+  for (const existing of existingQuestions) {
+    const existingFeatures = getQuestionFeatures(existing, regionName);
+    const jaccardScore = jaccardSimilarity(features.wordSet, existingFeatures.wordSet);
+    const cosineScore = cosineSimilarity(features.wordFreq, existingFeatures.wordFreq);
+    
+    // The Levenshtein score is at most 1, so skip the O(n * m) edit distance
+    // when even a perfect character-level match could not cross the threshold
+    if (combineScores(1, jaccardScore, cosineScore) <= threshold) {
+      continue;
+    }
+    
+    const levenshteinScore = levenshteinSimilarity(features.normalized, existingFeatures.normalized);
+    if (combineScores(levenshteinScore, jaccardScore, cosineScore) > threshold) {
+      return true;
+    }
+  }
+  return false;
 } 
\ No newline at end of file
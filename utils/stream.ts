@@ -1,3 +1,22 @@
+// Patterns shared by the extract helpers, compiled once at import
+const THINK_BLOCK_PATTERN = /<think>([\s\S]*?)<\/think>/;
+const THINK_BLOCKS_PATTERN = /<think>[\s\S]*?<\/think>/g;
+const NON_PRINTABLE_PATTERN = /[\x00-\x1F\x7F-\x9F]/g;
+const OBJECT_ARRAY_PATTERN = /\[\s*\{[^]*\}\s*\]/;
+const ANY_ARRAY_PATTERN = /\[[^\]]*\]/;
+
+// Cleanup applied in order to an extracted JSON array string
+const JSON_CLEANUP_RULES: ReadonlyArray<readonly [RegExp, string]> = Object.freeze([
+  [/[\u0000-\u0019]+/g, ''], // Remove control characters
+  [/。}/g, '}'], // Remove Chinese period before closing brace
+  [/。"/g, '"'], // Remove Chinese period before quotes
+  [/\s+/g, ' '], // Normalize whitespace
+  [/,\s*]/g, ']'], // Remove trailing commas
+  [/,\s*,/g, ','], // Remove duplicate commas
+  [/"\s*"/g, '","'], // Fix adjacent quotes
+  [/}\s*{/g, '},{'] // Fix adjacent objects
+] as const);
+
 /**
  * Processes stream data from API response and collects it into structured format
  * @param response - Raw API response
@@ -72,7 +91,7 @@ export async function processStreamData(response: any): Promise<{ content: strin
  * @returns Processed thinking content
  */
 export function extractThinkingContent(text: string): string {
-  const thinkMatch = text.match(/<think>([\s\S]*?)<\/think>/);
+  const thinkMatch = text.match(THINK_BLOCK_PATTERN);
   return thinkMatch ? thinkMatch[1].trim().slice(0, 1000) : '';
 }
 
@@ -82,7 +101,7 @@ export function extractThinkingContent(text: string): string {
  * @returns Processed content
  */
 export function extractContent(text: string): string {
-  text = text.replace(/<think>[\s\S]*?<\/think>/g, '').trim();
+  text = text.replace(THINK_BLOCKS_PATTERN, '').trim();
   const paragraphs = [...new Set(text.split('\n\n'))];
   return paragraphs.join('\n\n').slice(0, 2000);
 }
@@ -94,26 +113,19 @@ export function extractContent(text: string): string {
  */
 export function extractJSONArray(text: string): string {
   // Remove any non-printable characters and normalize whitespace
-  text = text.replace(/[\x00-\x1F\x7F-\x9F]/g, '');
+  text = text.replace(NON_PRINTABLE_PATTERN, '');
   
   // Find the outermost array containing questions
-  const match = text.match(/\[\s*\{[^]*\}\s*\]/);
+  const match = text.match(OBJECT_ARRAY_PATTERN);
   if (!match) {
     // Try to find any JSON array
-    const arrayMatch = text.match(/\[[^\]]*\]/);
+    const arrayMatch = text.match(ANY_ARRAY_PATTERN);
     if (!arrayMatch) return '';
     return arrayMatch[0];
   }
   
   // Clean up the JSON string
-  return match[0]
-    .replace(/[\u0000-\u0019]+/g, '') // Remove control characters
-    .replace(/。}/g, '}') // Remove Chinese period before closing brace
-    .replace(/。"/g, '"') // Remove Chinese period before quotes
-    .replace(/\s+/g, ' ') // Normalize whitespace
-    .replace(/,\s*]/g, ']') // Remove trailing commas
-    .replace(/,\s*,/g, ',') // Remove duplicate commas
-    .replace(/"\s*"/g, '","') // Fix adjacent quotes
-    .replace(/}\s*{/g, '},{') // Fix adjacent objects
+  return JSON_CLEANUP_RULES
+    .reduce((json, [pattern, replacement]) => json.replace(pattern, replacement), match[0])
     .trim();
 } 
\ No newline at end of file
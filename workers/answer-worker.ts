@@ -1,24 +1,10 @@
-import { setupGroqEnvironment } from '../providers/groq/client';
-import { groqService } from '../providers/groq/service';
-import { setupQianFanEnvironment } from '../providers/qianfan/client';
-import { qianfanService } from '../providers/qianfan/service';
+import { getAIService } from '../providers';
 import type { QAItem } from '../types/types';
 import type { AnswerWorkerTask } from '../types/worker';
 import Logger from '../utils/logger';
 
-// Initialize the environment based on provider
-const provider = process.env.AI_PROVIDER?.toLowerCase() || 'qianfan';
-
-// Initialize service
-let service: typeof qianfanService | typeof groqService;
-
-if (provider === 'qianfan') {
-  setupQianFanEnvironment();
-  service = qianfanService;
-} else if (provider === 'groq') {
-  setupGroqEnvironment();
-  service = groqService;
-}
+// Initialize the environment and service based on provider
+const service = getAIService();
 
 /**
  * Worker thread for generating answers
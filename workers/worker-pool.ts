@@ -8,13 +8,22 @@ declare class Worker {
 
 import Logger from '../utils/logger';
 
+/**
+ * A task waiting for, or currently running on, a worker
+ */
+interface PendingTask {
+  task: any;
+  resolve: (value: any) => void;
+  reject: (reason?: any) => void;
+}
+
 /**
  * A simple worker pool implementation for managing multiple worker threads
  */
 export class WorkerPool {
   private workers: Worker[];
-  private taskQueue: (() => Promise<any>)[];
-  private busyWorkers: Set<Worker>;
+  private taskQueue: PendingTask[];
+  private busyWorkers: Map<Worker, PendingTask>;
   private poolId: string;
 
   /**
@@ -25,11 +34,11 @@ export class WorkerPool {
   constructor(size: number, workerScript: string) {
     this.workers = Array.from({ length: size }, () => new Worker(workerScript));
     this.taskQueue = [];
-    this.busyWorkers = new Set();
+    this.busyWorkers = new Map();
     this.poolId = Math.random().toString(36).substring(7);
     Logger.info(`Created worker pool with ${size} workers`, '👥');
 
-    // Set up message handlers for each worker
+    // Set up message handlers for each worker once; tasks are routed through busyWorkers
     this.workers.forEach((worker, index) => {
       worker.onmessage = (e) => {
         this.handleWorkerMessage(worker, e.data);
@@ -47,45 +56,31 @@ export class WorkerPool {
    * @returns Promise that resolves with the task result
    */
   async execute<T>(task: any): Promise<T> {
-    return new Promise((resolve, reject) => {
+    return new Promise<T>((resolve, reject) => {
+      const pending: PendingTask = { task, resolve, reject };
       const worker = this.getAvailableWorker();
       
       if (worker) {
-        this.busyWorkers.add(worker);
-        worker.postMessage(task);
-        Logger.debug(`Assigned task to worker (${this.busyWorkers.size}/${this.workers.length} busy)`);
-        
-        const messageHandler = (e: MessageEvent) => {
-          worker.onmessage = null;
-          this.busyWorkers.delete(worker);
-          Logger.debug(`Task completed (${this.busyWorkers.size}/${this.workers.length} busy)`);
-          resolve(e.data as T);
-        };
-        
-        const errorHandler = (e: ErrorEvent) => {
-          worker.onerror = null;
-          this.busyWorkers.delete(worker);
-          Logger.error(`Worker error: ${e.message}`);
-          reject(e);
-        };
-        
-        worker.onmessage = messageHandler;
-        worker.onerror = errorHandler;
+        this.dispatch(worker, pending);
       } else {
         // Queue the task if no worker is available
-        Logger.debug(`No workers available, queuing task (${this.taskQueue.length + 1} tasks queued)`);
-        this.taskQueue.push(async () => {
-          try {
-            const result = await this.execute<T>(task);
-            resolve(result);
-          } catch (error) {
-            reject(error);
-          }
-        });
+        this.taskQueue.push(pending);
+        Logger.debug(`No workers available, queuing task (${this.taskQueue.length} tasks queued)`);
       }
     });
   }
 
+  /**
+   * Sends a task to a worker and marks the worker as busy
+   * @param worker - Idle worker
+   * @param pending - Task to run
+   */
+  private dispatch(worker: Worker, pending: PendingTask) {
+    this.busyWorkers.set(worker, pending);
+    worker.postMessage(pending.task);
+    Logger.debug(`Assigned task to worker (${this.busyWorkers.size}/${this.workers.length} busy)`);
+  }
+
   /**
    * Gets an available worker from the pool
    * @returns Available worker or null if none available
@@ -100,14 +95,12 @@ export class WorkerPool {
    * @param data - Message data
    */
   private handleWorkerMessage(worker: Worker, data: any) {
+    const pending = this.busyWorkers.get(worker);
     this.busyWorkers.delete(worker);
+    Logger.debug(`Task completed (${this.busyWorkers.size}/${this.workers.length} busy)`);
+    pending?.resolve(data);
     
-    // Process next task in queue if any
-    if (this.taskQueue.length > 0) {
-      const nextTask = this.taskQueue.shift();
-      Logger.debug(`Processing next queued task (${this.taskQueue.length} remaining)`);
-      nextTask?.();
-    }
+    this.processNextTask(worker);
   }
 
   /**
@@ -117,13 +110,22 @@ export class WorkerPool {
    */
   private handleWorkerError(worker: Worker, error: ErrorEvent) {
     Logger.error(`Worker error: ${error.message}`);
+    const pending = this.busyWorkers.get(worker);
     this.busyWorkers.delete(worker);
+    pending?.reject(error);
     
-    // Process next task in queue if any
-    if (this.taskQueue.length > 0) {
-      const nextTask = this.taskQueue.shift();
-      Logger.debug(`Processing next queued task after error (${this.taskQueue.length} remaining)`);
-      nextTask?.();
+    this.processNextTask(worker);
+  }
+
+  /**
+   * Hands the next queued task, if any, to a worker that just became idle
+   * @param worker - Idle worker
+   */
+  private processNextTask(worker: Worker) {
+    const nextTask = this.taskQueue.shift();
+    if (nextTask) {
+      Logger.debug(`Processing next queued task (${this.taskQueue.length} remaining)`);
+      this.dispatch(worker, nextTask);
     }
   }
 